@@ -11,8 +11,159 @@ d'un réseau cellulaire GSM
 """
 
 import numpy as np
+import functools
+from dataclasses import dataclass, fields
 import json
+import math
 import os
+import sys
+import textwrap
+from operator import itemgetter
+
+try:
+    # Fonctions scalaires compilées (cythonize -i back_end_core.pyx)
+    import back_end_core as _core
+except ImportError:  # module compilé optionnel : repli sur du Python pur
+    _core = None
+
+
+def _json_default(obj):
+    # Scalaires NumPy (np.int64, np.float32...) écrits comme leur équivalent
+    # Python, avec ou sans orjson
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _json_dumps(params):
+    return json.dumps(params, indent=2, default=_json_default).encode("utf-8")
+
+
+try:
+    import orjson
+
+    def _loads(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Infinity / NaN (écrits par json) ne sont pas du JSON strict
+            return json.loads(data)
+
+    def _dumps(params):
+        # orjson écrirait inf et nan comme null : on passe alors par json,
+        # qui écrit Infinity / NaN, pour produire le même fichier sans orjson
+        if any(
+            isinstance(value, (float, np.floating)) and not math.isfinite(value)
+            for value in params.values()
+        ):
+            return _json_dumps(params)
+        return orjson.dumps(
+            params,
+            default=_json_default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+        )
+
+except ImportError:  # orjson optionnel : repli sur le module json standard
+
+    def _loads(data):
+        return json.loads(data)
+
+    _dumps = _json_dumps
+
+
+# Constantes invariantes, calculées une seule fois à l'import
+_HEX_AREA_COEF = 3.0 * math.sqrt(3.0) / 2.0  # surface hexagone = coef * R²
+_LN10_DIV_10 = math.log(10.0) / 10.0  # 10^(x/10) = exp(coef * x)
+
+# Plancher des grandeurs linéaires converties en dB (tableaux)
+_MIN_LINEAR = 1e-300
+
+# Gain total des antennes par défaut (dB), hypothèse simplificatrice
+DEFAULT_G_ANT_DB = 2.0
+
+# Paramètres lus par run_complete_analysis (les autres clés sont ignorées)
+ANALYSIS_PARAMS = (
+    "P_BTS_dBm",
+    "P_MS_dBm",
+    "P_sens_dBm",
+    "N_f",
+    "N",
+    "SIR_min_dB",
+    "Dst_ab",
+    "T_act",
+    "Pathloss_exp",
+    "d0_km",
+)
+
+# Extraction des paramètres de run_complete_analysis en un seul appel
+_PARAM_GETTER = itemgetter(*ANALYSIS_PARAMS)
+
+
+@functools.lru_cache(maxsize=32)
+def _sqrt3N_cached(N):
+    return math.sqrt(3.0 * N)
+
+
+def _sqrt3N(N):
+    """
+    Retourne sqrt(3*N) : mis en cache pour un N scalaire (petit entier en
+    pratique), calculé avec NumPy pour un tableau
+    """
+    if isinstance(N, np.ndarray):
+        return np.sqrt(3.0 * N)
+    return _sqrt3N_cached(N)
+
+
+def _minimum(a, b):
+    """
+    Minimum élément par élément (min natif pour deux scalaires, NumPy sinon)
+    """
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        return np.minimum(a, b)
+    return min(a, b)
+
+
+def _to_dB(linear):
+    """
+    Convertit une grandeur linéaire en dB (math pour un scalaire, NumPy pour
+    un tableau)
+
+    Pour un tableau, les valeurs nulles ou négatives (géométrie invalide lors
+    d'un balayage) donnent un dB très négatif (-3000 dB) au lieu de NaN, sans
+    passer par le mécanisme d'avertissement de NumPy.
+    """
+    if isinstance(linear, np.ndarray):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return 10 * np.log10(np.maximum(linear, _MIN_LINEAR))
+    return 10.0 * math.log10(linear)
+
+
+def _from_dB(value_dB):
+    """
+    Convertit une grandeur en dB en linéaire, 10^(x/10), via une seule
+    exponentielle (math pour un scalaire, NumPy pour un tableau)
+    """
+    if isinstance(value_dB, np.ndarray):
+        return np.exp(value_dB * _LN10_DIV_10)
+    return math.exp(value_dB * _LN10_DIV_10)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_params_cached(filepath, mtime_ns, size):
+    with open(filepath, "rb") as f:
+        return _loads(f.read())
+
+
+def _read_params_file(filepath):
+    """
+    Lit un fichier de paramètres JSON, en réutilisant le résultat tant que
+    la date de modification (en ns) et la taille du fichier ne changent pas
+
+    Retourne une copie pour que l'appelant puisse la modifier sans altérer
+    le cache.
+    """
+    st = os.stat(filepath)
+    return dict(_load_params_cached(filepath, st.st_mtime_ns, st.st_size))
 
 
 def load_params(filename="params.json"):
@@ -30,15 +181,13 @@ def load_params(filename="params.json"):
         filepath = os.path.join(script_dir, filename)
 
         if os.path.exists(filepath):
-            with open(filepath, "r") as f:
-                params = json.load(f)
+            params = _read_params_file(filepath)
             print(f"✓ Paramètres chargés depuis {filepath}")
             return params
         else:
             # Try current working directory as fallback
             if os.path.exists(filename):
-                with open(filename, "r") as f:
-                    params = json.load(f)
+                params = _read_params_file(filename)
                 print(f"✓ Paramètres chargés depuis {filename}")
                 return params
             else:
@@ -68,8 +217,8 @@ def save_params(params, filename="params.json"):
     script_dir = os.path.dirname(os.path.abspath(__file__))
     filepath = os.path.join(script_dir, filename)
 
-    with open(filepath, "w") as f:
-        json.dump(params, f, indent=4)
+    with open(filepath, "wb") as f:
+        f.write(_dumps(params))
     print(f"✓ Paramètres sauvegardés dans {filepath}")
 
 
@@ -92,7 +241,7 @@ def get_default_params():
     }
 
 
-def calculate_max_path_loss(P_tx_dBm, P_sens_dBm, G_ant_dB=2):
+def calculate_max_path_loss(P_tx_dBm, P_sens_dBm, G_ant_dB=DEFAULT_G_ANT_DB):
     """
     Calcule la perte de trajet maximale admissible
 
@@ -108,7 +257,9 @@ def calculate_max_path_loss(P_tx_dBm, P_sens_dBm, G_ant_dB=2):
     return P_tx_dBm + G_ant_dB - P_sens_dBm
 
 
-def calculate_cell_radius(P_tx_dBm, P_sens_dBm, pathloss_exp, d0_km=1, G_ant_dB=2):
+def calculate_cell_radius(
+    P_tx_dBm, P_sens_dBm, pathloss_exp, d0_km=1, G_ant_dB=DEFAULT_G_ANT_DB
+):
     """
     Calcule le rayon maximal d'une cellule en utilisant le modèle log-distance
 
@@ -122,13 +273,14 @@ def calculate_cell_radius(P_tx_dBm, P_sens_dBm, pathloss_exp, d0_km=1, G_ant_dB=
         d0_km: distance de référence (km)
         G_ant_dB: gain des antennes (dB)
     Returns:
-        float: rayon maximal de la cellule (km)
+        float ou ndarray: rayon maximal de la cellule (km)
     """
-    PL_max = calculate_max_path_loss(P_tx_dBm, P_sens_dBm, G_ant_dB)
+    # Perte de trajet maximale (cf. calculate_max_path_loss), calculée en ligne
+    PL_max = P_tx_dBm + G_ant_dB - P_sens_dBm
 
     # PL(d) = 10*n*log10(d/d0)
     # d = d0 * 10^(PL/(10*n))
-    R = d0_km * (10 ** (PL_max / (10 * pathloss_exp)))
+    R = d0_km * _from_dB(PL_max / pathloss_exp)
 
     return R
 
@@ -145,14 +297,11 @@ def compute_reuse_distance(R_km, N):
     Returns:
         float: distance de réutilisation (km)
     """
-    return R_km * np.sqrt(3 * N)
+    return R_km * _sqrt3N(N)
 
 
-def calculate_reuse_distance(R, N):
-    """
-    Alias pour compatibilité - appelle compute_reuse_distance
-    """
-    return compute_reuse_distance(R, N)
+# Alias pour compatibilité - compute_reuse_distance est le nom canonique
+calculate_reuse_distance = compute_reuse_distance
 
 
 def compute_SIR(N, Pathloss_exp):
@@ -171,13 +320,13 @@ def compute_SIR(N, Pathloss_exp):
         float: S/I en dB
     """
     # D/R = sqrt(3*N) pour un motif hexagonal
-    D_over_R = np.sqrt(3 * N)
+    D_over_R = _sqrt3N(N)
 
     # S/I linéaire
     SIR_linear = (D_over_R**Pathloss_exp) / 6
 
     # Conversion en dB
-    SIR_dB = 10 * np.log10(SIR_linear)
+    SIR_dB = _to_dB(SIR_linear)
 
     return SIR_dB
 
@@ -201,7 +350,7 @@ def calculate_SIR(R, D, pathloss_exp):
     SIR_linear = ((D / R) ** pathloss_exp) / 6
 
     # Conversion en dB
-    SIR_dB = 10 * np.log10(SIR_linear)
+    SIR_dB = _to_dB(SIR_linear)
 
     return SIR_dB
 
@@ -221,22 +370,17 @@ def distribute_carriers(N_f: int, N: int):
 
     Retourne
     --------
-    carriers_cell : int
+    carriers_cell : ndarray of int
         Le nombre de porteuses attribuées à chaque cellule du motif.
         La répartition se fait de manière quasi uniforme :
             - division entière : N_f // N
             - +1 pour quelques cellules si N_f n'est pas divisible par N.
     """
-    base_carriers = N_f // N
-    remainder = N_f % N
+    base_carriers, remainder = divmod(N_f, N)
 
-    # Créer une liste avec la répartition des porteuses
-    carriers_distribution = []
-    for i in range(N):
-        if i < remainder:
-            carriers_distribution.append(base_carriers + 1)
-        else:
-            carriers_distribution.append(base_carriers)
+    # Répartition des porteuses : les `remainder` premières cellules en ont une de plus
+    carriers_distribution = np.full(N, base_carriers, dtype=np.int64)
+    carriers_distribution[:remainder] += 1
 
     return carriers_distribution
 
@@ -254,7 +398,9 @@ def calculate_channels_per_cell(N_f, N):
     return N_f // N
 
 
-def compute_cells_capacity(carriers: list, Dst_ab: float, T_act: float, R_km: float):
+def compute_cells_capacity(
+    carriers: np.ndarray, Dst_ab: float, T_act: float, R_km: float
+):
     """
     Calcule :
       - la capacité physique (en Erlangs) par cellule
@@ -264,7 +410,7 @@ def compute_cells_capacity(carriers: list, Dst_ab: float, T_act: float, R_km: fl
 
     Parameters
     ----------
-    carriers : list
+    carriers : array-like
         Nombre de porteuses par cellule du motif.
     Dst_ab : float
         Densité d'abonnés (abonnés / km²).
@@ -277,27 +423,24 @@ def compute_cells_capacity(carriers: list, Dst_ab: float, T_act: float, R_km: fl
     -------
     dict :
         {
-            "canaux_par_cellule": [...],
-            "abonnes_actifs_par_cellule": [...]
+            "canaux_par_cellule": ndarray,
+            "abonnes_actifs_par_cellule": ndarray
         }
     """
-    canaux_par_cellule = []
-    abonnes_par_cellule = []
+    carriers = np.asarray(carriers)
 
     # Surface d'une cellule hexagonale
     cell_area = calculate_cell_area(R_km)
 
-    for carrier_count in carriers:
-        # Capacité en Erlangs: 8 Erlangs par porteuse
-        capacity_erlangs = carrier_count * 8
-        canaux_par_cellule.append(capacity_erlangs)
+    # Capacité en Erlangs: 8 Erlangs par porteuse
+    canaux_par_cellule = carriers * 8
 
-        # Nombre d'abonnés actifs dans cette cellule
-        # Abonnés totaux = Densité × Surface
-        # Abonnés actifs = Abonnés totaux × Taux_activité
-        total_subscribers = Dst_ab * cell_area
-        active_subscribers = total_subscribers * T_act
-        abonnes_par_cellule.append(active_subscribers)
+    # Nombre d'abonnés actifs dans chaque cellule (identique pour toutes)
+    # Abonnés totaux = Densité × Surface
+    # Abonnés actifs = Abonnés totaux × Taux_activité
+    abonnes_par_cellule = np.full_like(
+        carriers, Dst_ab * cell_area * T_act, dtype=np.float64
+    )
 
     return {
         "canaux_par_cellule": canaux_par_cellule,
@@ -316,12 +459,14 @@ def calculate_cell_area(R):
     Returns:
         float: surface de la cellule (km²)
     """
-    return (3 * np.sqrt(3) / 2) * (R**2)
+    return _HEX_AREA_COEF * R * R
 
 
 def calculate_subscribers_per_cell(R, Dst_ab):
     """
     Calcule le nombre d'abonnés par cellule
+    (conservée pour compatibilité - calcul fait en ligne dans
+    run_complete_analysis)
 
     Args:
         R: rayon de la cellule (km)
@@ -336,6 +481,8 @@ def calculate_subscribers_per_cell(R, Dst_ab):
 def calculate_active_users(subscribers, T_act):
     """
     Calcule le nombre d'utilisateurs actifs simultanément
+    (conservée pour compatibilité - calcul fait en ligne dans
+    run_complete_analysis)
 
     Args:
         subscribers: nombre d'abonnés
@@ -394,7 +541,7 @@ def compute_final_radius(
         - Rmax_capacity en km : rayon max basé sur la capacité
         - R_final en km : rayon final optimal
     """
-    G_ant_dB = 2  # Gain des antennes (hypothèse simplificatrice)
+    G_ant_dB = DEFAULT_G_ANT_DB  # Gain des antennes (hypothèse simplificatrice)
 
     # 1. Rayon maximal basé sur la couverture (DOWNLINK: BTS -> MS)
     R_coverage_downlink = calculate_cell_radius(
@@ -417,8 +564,8 @@ def compute_final_radius(
 
     if density_ab > 0 and activity_rate > 0:
         # R² <= carriers_cell / (density_ab * activity_rate * 3*sqrt(3)/2)
-        R_squared = carriers_cell / (density_ab * activity_rate * (3 * np.sqrt(3) / 2))
-        Rmax_capacity = np.sqrt(R_squared)
+        R_squared = carriers_cell / (density_ab * activity_rate * _HEX_AREA_COEF)
+        Rmax_capacity = math.sqrt(R_squared)
     else:
         Rmax_capacity = float("inf")  # Pas de contrainte de capacité
 
@@ -435,6 +582,9 @@ def adjust_radius_for_SIR(
     Ajuste le rayon de cellule pour respecter le critère S/I minimum
     (VERSION ORIGINALE - conservée pour compatibilité)
 
+    Tous les arguments numériques peuvent être des tableaux NumPy : le calcul
+    est alors effectué en une seule passe vectorisée.
+
     Args:
         P_BTS_dBm: puissance BTS (dBm)
         P_MS_dBm: puissance MS (dBm)
@@ -455,28 +605,46 @@ def adjust_radius_for_SIR(
     R_coverage_uplink = calculate_cell_radius(P_MS_dBm, P_sens_dBm, pathloss_exp, d0_km)
 
     # Le rayon est limité par le lien le plus faible
-    R_coverage = min(R_coverage_downlink, R_coverage_uplink)
+    R_coverage = _minimum(R_coverage_downlink, R_coverage_uplink)
 
-    # Distance de réutilisation
-    D = calculate_reuse_distance(R_coverage, N)
+    # S/I obtenu : S/I = (D/R)^n / 6 avec D/R = sqrt(3*N), il ne dépend donc
+    # que de N et n (invariant par changement d'échelle de R)
+    SIR_obtained = compute_SIR(N, pathloss_exp)
 
-    # S/I obtenu
-    SIR_obtained = calculate_SIR(R_coverage, D, pathloss_exp)
+    # Si S/I n'est pas satisfait, réduire R d'un facteur sqrt(3*N)/ratio.
+    # S/I < S/I_min  <=>  sqrt(3*N) < ratio : le facteur min(1, sqrt(3*N)/ratio)
+    # couvre donc les deux cas sans branchement
+    ratio = (6 * _from_dB(SIR_min_dB)) ** (1 / pathloss_exp)
+    R_final = R_coverage * _minimum(1.0, _sqrt3N(N) / ratio)
 
-    # Si S/I n'est pas satisfait, réduire R
-    if SIR_obtained < SIR_min_dB:
-        ratio = (6 * (10 ** (SIR_min_dB / 10))) ** (1 / pathloss_exp)
-        R_sir = R_coverage * np.sqrt(3 * N) / ratio
+    # Distance de réutilisation pour le rayon final ; le S/I est inchangé
+    D_final = compute_reuse_distance(R_final, N)
 
-        R_final = min(R_coverage, R_sir)
-    else:
-        R_final = R_coverage
+    return R_final, D_final, SIR_obtained
+
+
+@dataclass(slots=True, frozen=True)
+class AnalysisResult:
+    """
+    Résultats d'une analyse complète du réseau
+    """
 
-    # Recalculer avec le rayon final
-    D_final = calculate_reuse_distance(R_final, N)
-    SIR_final = calculate_SIR(R_final, D_final, pathloss_exp)
+    R_km: float
+    D_km: float
+    SIR_dB: float
+    SIR_min_dB: float
+    SIR_ok: bool
+    cell_area_km2: float
+    channels_per_cell: int
+    subscribers_per_cell: float
+    active_users_per_cell: float
+    capacity_ok: bool
 
-    return R_final, D_final, SIR_final
+    def to_dict(self):
+        """
+        Retourne les résultats sous forme de dictionnaire (ex: pour JSON)
+        """
+        return {field.name: getattr(self, field.name) for field in fields(self)}
 
 
 def run_complete_analysis(params):
@@ -486,76 +654,348 @@ def run_complete_analysis(params):
     Args:
         params: dictionnaire des paramètres
     Returns:
-        dict: résultats de l'analyse
+        AnalysisResult: résultats de l'analyse
     """
     # Extraction des paramètres
+    (
+        P_BTS_dBm,
+        P_MS_dBm,
+        P_sens_dBm,
+        N_f,
+        N,
+        SIR_min_dB,
+        Dst_ab,
+        T_act,
+        pathloss_exp,
+        d0_km,
+    ) = _PARAM_GETTER(params)
+
+    # Calculs (version compilée si disponible et si tous les paramètres
+    # sont scalaires). Tests isinstance en ligne : un générateur any(...)
+    # coûterait à lui seul plus que l'appel compilé
+    ndarray = np.ndarray
+    if _core is not None and not (
+        isinstance(P_BTS_dBm, ndarray)
+        or isinstance(P_MS_dBm, ndarray)
+        or isinstance(P_sens_dBm, ndarray)
+        or isinstance(N, ndarray)
+        or isinstance(SIR_min_dB, ndarray)
+        or isinstance(pathloss_exp, ndarray)
+        or isinstance(d0_km, ndarray)
+    ):
+        R, D, SIR = _core.adjust_radius_for_SIR(
+            P_BTS_dBm,
+            P_MS_dBm,
+            P_sens_dBm,
+            N,
+            SIR_min_dB,
+            pathloss_exp,
+            d0_km,
+            DEFAULT_G_ANT_DB,
+        )
+    else:
+        R, D, SIR = adjust_radius_for_SIR(
+            P_BTS_dBm, P_MS_dBm, P_sens_dBm, N, SIR_min_dB, pathloss_exp, d0_km
+        )
+
+    channels_per_cell = calculate_channels_per_cell(N_f, N)
+
+    # Surface, abonnés et utilisateurs actifs calculés en une seule passe
+    cell_area = _HEX_AREA_COEF * R * R
+    subscribers = cell_area * Dst_ab
+    active_users = subscribers * T_act
+
+    # Résultats
+    results = AnalysisResult(
+        R_km=R,
+        D_km=D,
+        SIR_dB=SIR,
+        SIR_min_dB=SIR_min_dB,
+        SIR_ok=SIR >= SIR_min_dB,
+        cell_area_km2=cell_area,
+        channels_per_cell=channels_per_cell,
+        subscribers_per_cell=subscribers,
+        active_users_per_cell=active_users,
+        capacity_ok=active_users <= channels_per_cell,
+    )
+
+    return results
+
+
+@functools.lru_cache(maxsize=None)
+def _numba_monte_carlo():
+    """
+    Retourne le noyau Numba de run_monte_carlo, ou None si Numba n'est pas
+    installé
+
+    L'import (coûteux) de Numba est fait au premier appel seulement, pour ne
+    pas ralentir l'import de back_end.
+    """
+    try:
+        from back_end_numba import monte_carlo
+    except ImportError:  # Numba optionnel : repli sur NumPy
+        return None
+    return monte_carlo
+
+
+def run_monte_carlo(params, n_snapshots, sigma_dB, seed=None):
+    """
+    Effectue un tirage Monte-Carlo du rayon de cellule sous évanouissement
+    lent (shadowing log-normal)
+
+    Pour chaque réalisation, une atténuation X ~ N(0, sigma_dB) (en dB) est
+    ajoutée à la perte de trajet des deux liens. Le calcul est compilé avec
+    Numba s'il est disponible, sinon il est vectorisé avec NumPy.
+
+    Args:
+        params: dictionnaire des paramètres
+        n_snapshots: nombre de réalisations
+        sigma_dB: écart-type du shadowing (dB)
+        seed: graine du générateur aléatoire
+    Returns:
+        dict: rayons et distances de réutilisation (tableaux), S/I (dB)
+    """
     P_BTS_dBm = params["P_BTS_dBm"]
     P_MS_dBm = params["P_MS_dBm"]
     P_sens_dBm = params["P_sens_dBm"]
-    N_f = params["N_f"]
     N = params["N"]
     SIR_min_dB = params["SIR_min_dB"]
-    Dst_ab = params["Dst_ab"]
-    T_act = params["T_act"]
     pathloss_exp = params["Pathloss_exp"]
     d0_km = params["d0_km"]
 
-    # Calculs
-    R, D, SIR = adjust_radius_for_SIR(
-        P_BTS_dBm, P_MS_dBm, P_sens_dBm, N, SIR_min_dB, pathloss_exp, d0_km
-    )
-
-    channels_per_cell = calculate_channels_per_cell(N_f, N)
-    cell_area = calculate_cell_area(R)
-    subscribers = calculate_subscribers_per_cell(R, Dst_ab)
-    active_users = calculate_active_users(subscribers, T_act)
+    rng = np.random.default_rng(seed)
+    shadow_dB = rng.normal(0.0, sigma_dB, n_snapshots)
+
+    monte_carlo_nb = _numba_monte_carlo()
+    if monte_carlo_nb is not None:
+        R = monte_carlo_nb(
+            float(P_BTS_dBm),
+            float(P_MS_dBm),
+            float(P_sens_dBm),
+            float(N),
+            float(SIR_min_dB),
+            float(pathloss_exp),
+            float(d0_km),
+            DEFAULT_G_ANT_DB,
+            shadow_dB,
+        )
+    else:
+        R = adjust_radius_for_SIR(
+            P_BTS_dBm - shadow_dB,
+            P_MS_dBm - shadow_dB,
+            P_sens_dBm,
+            N,
+            SIR_min_dB,
+            pathloss_exp,
+            d0_km,
+        )[0]
 
-    # Résultats
-    results = {
+    return {
         "R_km": R,
-        "D_km": D,
-        "SIR_dB": SIR,
-        "SIR_min_dB": SIR_min_dB,
-        "SIR_ok": SIR >= SIR_min_dB,
-        "cell_area_km2": cell_area,
-        "channels_per_cell": channels_per_cell,
-        "subscribers_per_cell": subscribers,
-        "active_users_per_cell": active_users,
-        "capacity_ok": active_users <= channels_per_cell,
+        "D_km": compute_reuse_distance(R, N),
+        "SIR_dB": compute_SIR(N, pathloss_exp),
     }
 
-    return results
 
+def _hex_lattice(rings, spacing=1.0):
+    """
+    Génère les centres d'un réseau hexagonal de `rings` anneaux autour de
+    l'origine (1 + 3*rings*(rings+1) points)
 
-def print_results(results, params):
+    Args:
+        rings: nombre d'anneaux autour de la cellule centrale
+        spacing: distance entre centres voisins
+    Returns:
+        ndarray: coordonnées (x, y) des centres, de forme (K, 2)
     """
-    Affiche les résultats de manière formatée
+    q, s = np.mgrid[-rings : rings + 1, -rings : rings + 1]
+    mask = np.abs(q + s) <= rings
+    q, s = q[mask], s[mask]
+
+    return spacing * np.column_stack([q + 0.5 * s, (math.sqrt(3.0) / 2.0) * s])
+
+
+def compute_SIR_cdf(
+    N, n_snapshots, sigma_dB, pathloss_exp, rings=4, seed=None, batch_size=10000
+):
     """
-    print("\n" + "=" * 60)
-    print("RÉSULTATS DE LA PLANIFICATION DU RÉSEAU CELLULAIRE")
-    print("=" * 60)
-
-    print(f"\n📡 CONFIGURATION:")
-    print(f"   Motif cellulaire (N): {params['N']}")
-    print(f"   Canaux disponibles: {params['N_f']}")
-    print(f"   Exposant de propagation: {params['Pathloss_exp']}")
-
-    print(f"\n📏 DIMENSIONS:")
-    print(f"   Rayon de cellule (R): {results['R_km']:.3f} km")
-    print(f"   Distance de réutilisation (D): {results['D_km']:.3f} km")
-    print(f"   Surface de cellule: {results['cell_area_km2']:.3f} km²")
-
-    print(f"\n📶 INTERFÉRENCES:")
-    print(f"   S/I minimum requis: {results['SIR_min_dB']:.1f} dB")
-    print(f"   S/I obtenu: {results['SIR_dB']:.2f} dB")
-    status = "✓ OK" if results["SIR_ok"] else "✗ INSUFFISANT"
-    print(f"   Statut: {status}")
-
-    print(f"\n👥 CAPACITÉ:")
-    print(f"   Canaux par cellule: {results['channels_per_cell']}")
-    print(f"   Abonnés par cellule: {results['subscribers_per_cell']:.0f}")
-    print(f"   Utilisateurs actifs: {results['active_users_per_cell']:.1f}")
-    capacity_status = "✓ OK" if results["capacity_ok"] else "✗ SURCHARGE"
-    print(f"   Statut capacité: {capacity_status}")
-
-    print("=" * 60 + "\n")
+    Estime la distribution (CDF) du S/I par tirage Monte-Carlo sur un réseau
+    hexagonal de cellules co-canal avec shadowing log-normal
+
+    Les stations co-canal sont placées sur un réseau hexagonal de pas
+    D = R*sqrt(3*N) (R = 1, le S/I étant invariant d'échelle). Pour chaque
+    réalisation, l'utilisateur est tiré uniformément dans la cellule
+    centrale ; il est servi par la station reçue le plus fort et les autres
+    stations co-canal constituent l'interférence.
+
+    Args:
+        N: taille du motif cellulaire
+        n_snapshots: nombre de réalisations
+        sigma_dB: écart-type du shadowing (dB)
+        pathloss_exp: exposant de perte de propagation
+        rings: nombre d'anneaux d'interféreurs
+        seed: graine du générateur aléatoire
+        batch_size: nombre de réalisations traitées par bloc (mémoire)
+    Returns:
+        tuple: (SIR_dB triés, probabilités cumulées)
+    """
+    rng = np.random.default_rng(seed)
+    bs_xy = _hex_lattice(rings, spacing=_sqrt3N(N))
+
+    # Sommets de l'hexagone de rayon 1 : il est l'union de 3 losanges
+    # engendrés par les sommets (0, 2), (2, 4) et (4, 0)
+    angles = np.deg2rad(np.arange(6) * 60.0)
+    vertices = np.column_stack([np.cos(angles), np.sin(angles)])
+
+    SIR_dB = np.empty(n_snapshots)
+    for start in range(0, n_snapshots, batch_size):
+        count = min(batch_size, n_snapshots - start)
+
+        # Position uniforme de l'utilisateur dans la cellule centrale
+        k = 2 * rng.integers(0, 3, count)
+        u, w = rng.random((2, count, 1))
+        user_xy = u * vertices[k] + w * vertices[(k + 2) % 6]
+
+        # Puissance reçue (linéaire) de chaque station : d^-n * shadowing
+        d = np.linalg.norm(bs_xy[None, :, :] - user_xy[:, None, :], axis=-1)
+        shadow_dB = rng.normal(0.0, sigma_dB, d.shape)
+        P_rx = np.exp(shadow_dB * _LN10_DIV_10 - pathloss_exp * np.log(d))
+
+        P_serving = P_rx.max(axis=1)
+        interference = P_rx.sum(axis=1) - P_serving
+        SIR_dB[start : start + count] = _to_dB(P_serving / interference)
+
+    SIR_dB.sort()
+    cdf = np.arange(1, n_snapshots + 1) / n_snapshots
+
+    return SIR_dB, cdf
+
+
+def run_complete_analysis_vec(params):
+    """
+    Effectue une analyse complète du réseau sur un balayage de paramètres
+
+    Chaque valeur du dictionnaire peut être un scalaire ou un tableau NumPy ;
+    les tableaux sont combinés par broadcasting et toutes les configurations
+    sont évaluées en une seule passe vectorisée.
+
+    Args:
+        params: dictionnaire des paramètres (scalaires ou tableaux)
+    Returns:
+        dict: résultats de l'analyse, chaque valeur étant un tableau
+    """
+    arrays = {key: np.asarray(value) for key, value in params.items()}
+    shape = np.broadcast_shapes(*(value.shape for value in arrays.values()))
+
+    results = run_complete_analysis(arrays).to_dict()
+
+    return {key: np.broadcast_to(value, shape) for key, value in results.items()}
+
+
+def make_specialized(N, pathloss_exp, SIR_min_dB):
+    """
+    Génère une version spécialisée de run_complete_analysis pour un motif N,
+    un exposant de propagation et un S/I minimum fixés
+
+    Toutes les grandeurs qui ne dépendent que de ces trois paramètres
+    (sqrt(3*N), S/I, facteur de réduction du rayon, ...) sont calculées une
+    fois et inscrites comme constantes dans le code généré. Utile pour les
+    balayages où seuls les paramètres de puissance ou de trafic varient.
+
+    Args:
+        N: taille du motif cellulaire
+        pathloss_exp: exposant de perte de propagation
+        SIR_min_dB: S/I minimum requis (dB)
+    Returns:
+        function: f(P_BTS_dBm, P_MS_dBm, P_sens_dBm, N_f, Dst_ab, T_act, d0_km)
+            retournant un AnalysisResult
+    """
+    G = DEFAULT_G_ANT_DB
+    k = _LN10_DIV_10 / pathloss_exp  # R = d0 * exp(PL_max * k)
+    sqrt3N = math.sqrt(3.0 * N)
+    SIR_dB = compute_SIR(N, pathloss_exp)
+    ratio = (6.0 * _from_dB(SIR_min_dB)) ** (1.0 / pathloss_exp)
+    scale = min(1.0, sqrt3N / ratio)
+    SIR_ok = SIR_dB >= SIR_min_dB
+
+    # Les constantes sont passées par l'espace de noms du code généré plutôt
+    # qu'insérées par repr() : les scalaires NumPy (np.float64(3.5)) et les
+    # valeurs spéciales (inf, nan) n'ont pas de repr évaluable ici
+    src = textwrap.dedent(
+        """
+        def _analysis(P_BTS_dBm, P_MS_dBm, P_sens_dBm, N_f, Dst_ab, T_act, d0_km):
+            R_downlink = d0_km * exp((P_BTS_dBm + _G - P_sens_dBm) * _K)
+            R_uplink = d0_km * exp((P_MS_dBm + _G - P_sens_dBm) * _K)
+            R = (R_downlink if R_downlink < R_uplink else R_uplink) * _SCALE
+            cell_area = _HEX_AREA_COEF * R * R
+            subscribers = cell_area * Dst_ab
+            active_users = subscribers * T_act
+            channels_per_cell = N_f // _N
+            return AnalysisResult(
+                R, R * _SQRT3N, _SIR_DB, _SIR_MIN_DB, _SIR_OK,
+                cell_area, channels_per_cell, subscribers, active_users,
+                active_users <= channels_per_cell,
+            )
+        """
+    )
+    namespace = {
+        "exp": math.exp,
+        "AnalysisResult": AnalysisResult,
+        "_HEX_AREA_COEF": _HEX_AREA_COEF,
+        "_G": G,
+        "_K": k,
+        "_SCALE": scale,
+        "_N": N,
+        "_SQRT3N": sqrt3N,
+        "_SIR_DB": SIR_dB,
+        "_SIR_MIN_DB": SIR_min_dB,
+        "_SIR_OK": SIR_ok,
+    }
+    exec(src, namespace)
+
+    return namespace["_analysis"]
+
+
+def print_results(results, params, file=None):
+    """
+    Affiche les résultats de manière formatée
+
+    Le texte est construit en entier puis écrit en une seule fois.
+
+    Args:
+        results: résultats de l'analyse (AnalysisResult)
+        params: dictionnaire des paramètres
+        file: flux de sortie (sys.stdout par défaut)
+    """
+    sir_status = "✓ OK" if results.SIR_ok else "✗ INSUFFISANT"
+    capacity_status = "✓ OK" if results.capacity_ok else "✗ SURCHARGE"
+
+    text = f"""
+{"=" * 60}
+RÉSULTATS DE LA PLANIFICATION DU RÉSEAU CELLULAIRE
+{"=" * 60}
+
+📡 CONFIGURATION:
+   Motif cellulaire (N): {params['N']}
+   Canaux disponibles: {params['N_f']}
+   Exposant de propagation: {params['Pathloss_exp']}
+
+📏 DIMENSIONS:
+   Rayon de cellule (R): {results.R_km:.3f} km
+   Distance de réutilisation (D): {results.D_km:.3f} km
+   Surface de cellule: {results.cell_area_km2:.3f} km²
+
+📶 INTERFÉRENCES:
+   S/I minimum requis: {results.SIR_min_dB:.1f} dB
+   S/I obtenu: {results.SIR_dB:.2f} dB
+   Statut: {sir_status}
+
+👥 CAPACITÉ:
+   Canaux par cellule: {results.channels_per_cell}
+   Abonnés par cellule: {results.subscribers_per_cell:.0f}
+   Utilisateurs actifs: {results.active_users_per_cell:.1f}
+   Statut capacité: {capacity_status}
+{"=" * 60}
+
+"""
+    (file or sys.stdout).write(text)
@@ -0,0 +1,110 @@
+# cython: language_level=3
+"""
+back_end_core.pyx
+Version compilée (Cython) des fonctions de calcul scalaires de back_end.py
+
+Chaque fonction travaille uniquement sur des `double` C : aucun objet Python
+n'est créé pendant le calcul. Compilation :
+
+    cythonize -i back_end_core.pyx
+
+back_end.py utilise automatiquement ce module s'il est compilé, et revient
+sinon aux fonctions Python. Les entrées invalides lèvent les mêmes exceptions
+que les fonctions math de Python (ZeroDivisionError, ValueError,
+OverflowError) au lieu de produire silencieusement NaN ou inf, pour que les
+résultats ne dépendent pas de la présence du module compilé.
+"""
+
+from libc.math cimport exp, fmin, isinf, log, log10, pow, sqrt
+
+cdef double LN10_DIV_10 = log(10.0) / 10.0
+
+
+# Équivalents de math.exp, math.sqrt, math.log10 et de l'opérateur ** sur
+# des flottants Python : mêmes cas d'erreur. Le GIL n'est repris que pour
+# lever l'exception
+cdef inline double _exp(double x) except? -1.0 nogil:
+    cdef double r = exp(x)
+    if isinf(r) and not isinf(x):
+        with gil:
+            raise OverflowError("math range error")
+    return r
+
+
+cdef inline double _sqrt(double x) except? -1.0 nogil:
+    if x < 0.0:
+        with gil:
+            raise ValueError("math domain error")
+    return sqrt(x)
+
+
+cdef inline double _log10(double x) except? -1.0 nogil:
+    if x <= 0.0:
+        with gil:
+            raise ValueError("math domain error")
+    return log10(x)
+
+
+cdef inline double _pow(double x, double y) except? -1.0 nogil:
+    cdef double r
+    if x == 0.0 and y < 0.0:
+        with gil:
+            raise ZeroDivisionError("0.0 cannot be raised to a negative power")
+    r = pow(x, y)
+    if isinf(r) and not isinf(x) and not isinf(y):
+        with gil:
+            raise OverflowError("Numerical result out of range")
+    return r
+
+
+cpdef double cell_radius(
+    double P_tx_dBm,
+    double P_sens_dBm,
+    double pathloss_exp,
+    double d0_km=1.0,
+    double G_ant_dB=2.0,
+) except? -1.0 nogil:
+    """
+    Calcule le rayon maximal d'une cellule (cf. back_end.calculate_cell_radius)
+    """
+    return d0_km * _exp((P_tx_dBm + G_ant_dB - P_sens_dBm) / pathloss_exp * LN10_DIV_10)
+
+
+cpdef double compute_SIR(double N, double pathloss_exp) except? -1.0 nogil:
+    """
+    Calcule le S/I en dB du motif hexagonal (cf. back_end.compute_SIR)
+    """
+    return 10.0 * _log10(_pow(_sqrt(3.0 * N), pathloss_exp) / 6.0)
+
+
+cpdef tuple adjust_radius_for_SIR(
+    double P_BTS_dBm,
+    double P_MS_dBm,
+    double P_sens_dBm,
+    double N,
+    double SIR_min_dB,
+    double pathloss_exp,
+    double d0_km=1.0,
+    double G_ant_dB=2.0,
+):
+    """
+    Ajuste le rayon de cellule pour respecter le critère S/I minimum
+    (cf. back_end.adjust_radius_for_SIR)
+
+    Returns:
+        tuple: (R_final, D, SIR_obtained)
+    """
+    cdef double R, SIR, sqrt3N, ratio
+
+    R = fmin(
+        cell_radius(P_BTS_dBm, P_sens_dBm, pathloss_exp, d0_km, G_ant_dB),
+        cell_radius(P_MS_dBm, P_sens_dBm, pathloss_exp, d0_km, G_ant_dB),
+    )
+
+    SIR = compute_SIR(N, pathloss_exp)
+
+    sqrt3N = sqrt(3.0 * N)
+    ratio = _pow(6.0 * _exp(SIR_min_dB * LN10_DIV_10), 1.0 / pathloss_exp)
+    R *= fmin(1.0, sqrt3N / ratio)
+
+    return R, R * sqrt3N, SIR
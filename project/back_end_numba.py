@@ -0,0 +1,45 @@
+"""
+back_end_numba.py
+Noyaux compilés avec Numba pour les tirages Monte-Carlo de back_end.py
+
+Ce module n'est importé par back_end.run_monte_carlo qu'au premier appel :
+l'import de Numba est coûteux et inutile pour une analyse simple.
+"""
+
+import math
+
+import numpy as np
+from numba import njit, prange
+
+from back_end import _LN10_DIV_10
+
+
+@njit(cache=True, fastmath=True)
+def cell_radius(P_tx, P_sens, n, d0, G):
+    return d0 * math.exp((P_tx + G - P_sens) * _LN10_DIV_10 / n)
+
+
+@njit(cache=True, fastmath=True)
+def adjust_radius_for_SIR(P_BTS, P_MS, P_sens, N, SIR_min, n, d0, G):
+    # Même calcul que adjust_radius_for_SIR, limité aux scalaires
+    R_downlink = cell_radius(P_BTS, P_sens, n, d0, G)
+    R_uplink = cell_radius(P_MS, P_sens, n, d0, G)
+    R = min(R_downlink, R_uplink)
+
+    sqrt3N = math.sqrt(3.0 * N)
+    SIR = 10.0 * math.log10(sqrt3N**n / 6.0)
+
+    ratio = (6.0 * math.exp(SIR_min * _LN10_DIV_10)) ** (1.0 / n)
+    R = R * min(1.0, sqrt3N / ratio)
+
+    return R, R * sqrt3N, SIR
+
+
+@njit(cache=True, parallel=True)
+def monte_carlo(P_BTS, P_MS, P_sens, N, SIR_min, n, d0, G, shadow_dB):
+    R = np.empty(shadow_dB.shape[0])
+    for i in prange(shadow_dB.shape[0]):
+        R[i] = adjust_radius_for_SIR(
+            P_BTS - shadow_dB[i], P_MS - shadow_dB[i], P_sens, N, SIR_min, n, d0, G
+        )[0]
+    return R
@@ -4,13 +4,37 @@ Module de visualisation et d'interaction utilisateur pour la planification
 d'un réseau cellulaire GSM
 """
 
+import sys
+from functools import lru_cache
+from operator import itemgetter
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 import numpy as np
-from matplotlib.patches import RegularPolygon
+from matplotlib.collections import PolyCollection
 import back_end as be
 
-def create_hexagon_grid(R, grid_size=7):
+# Sommets d'un hexagone de rayon 1 (pointe en haut), calculés une seule fois
+_UNIT_HEX_ANGLES = np.deg2rad(np.arange(6) * 60 + 30)
+_UNIT_HEX_VERTICES = np.column_stack([np.cos(_UNIT_HEX_ANGLES),
+                                      np.sin(_UNIT_HEX_ANGLES)])
+
+@lru_cache(maxsize=8)
+def _hex_offsets(R):
+    """
+    Retourne les décalages (6, 2) des sommets d'un hexagone de rayon R par
+    rapport à son centre (tableau en lecture seule, partagé via le cache)
+    """
+    offsets = R * _UNIT_HEX_VERTICES
+    offsets.flags.writeable = False
+    return offsets
+
+# Nombre maximal de cellules étiquetées (F0, F1, ...) sur le plan
+_MAX_LABELED_CELLS = 64
+
+# Nombre maximal de groupes de fréquences détaillés dans la légende
+_MAX_LEGEND_GROUPS = 12
+
+def create_hexagon_grid(R: float, grid_size: int = 7) -> np.ndarray:
     """
     Crée une grille hexagonale de stations de base
     
@@ -18,160 +42,202 @@ def create_hexagon_grid(R, grid_size=7):
         R: rayon de la cellule (km)
         grid_size: taille de la grille (ex: 7 pour 7x7)
     Returns:
-        list: liste de coordonnées (x, y) des centres de cellules
+        ndarray: coordonnées (x, y) des centres de cellules, de forme (N, 2)
     """
-    centers = []
-    
     # Distance horizontale et verticale entre hexagones
     dx = R * np.sqrt(3)
     dy = R * 1.5
     
-    # Générer la grille
-    for row in range(grid_size):
-        for col in range(grid_size):
-            # Décalage pour les rangées impaires
-            x = col * dx + (row % 2) * dx / 2
-            y = row * dy
-            centers.append((x, y))
+    # Générer la grille par broadcasting (lignes x colonnes)
+    rows = np.arange(grid_size)[:, None]
+    cols = np.arange(grid_size)[None, :]
+    
+    # Décalage d'une demi-cellule pour les rangées impaires
+    x = (cols + (rows % 2) * 0.5) * dx
+    y = rows * dy
+    
+    centers = np.stack(np.broadcast_arrays(x, y), axis=-1).reshape(-1, 2)
     
     return centers
 
-def assign_frequency_groups(centers, N):
+def assign_frequency_groups(centers: np.ndarray, N: int) -> np.ndarray:
     """
     Assigne des groupes de fréquences aux cellules selon le motif N
     
     Args:
-        centers: liste des coordonnées des cellules
+        centers: coordonnées des cellules, de forme (N, 2)
         N: taille du motif cellulaire
     Returns:
-        list: liste des groupes de fréquences pour chaque cellule
+        ndarray: groupes de fréquences pour chaque cellule (i % N)
     """
-    frequency_groups = []
-    
-    for i, (x, y) in enumerate(centers):
-        # Algorithme simple basé sur la position
-        # Pour N=3: motif (0,1,2) se répète
-        # Pour N=7: motif plus complexe
-        
-        if N == 3:
-            group = i % 3
-        elif N == 4:
-            group = i % 4
-        elif N == 7:
-            # Motif hexagonal pour N=7
-            group = i % 7
-        elif N == 9:
-            group = i % 9
-        elif N == 12:
-            group = i % 12
-        else:
-            group = i % N
-        
-        frequency_groups.append(group)
-    
-    return frequency_groups
+    return np.mod(np.arange(len(centers)), N)
 
+@lru_cache(maxsize=16)
 def get_color_palette(N):
     """
     Génère une palette de couleurs pour N groupes de fréquences
+    
+    Le résultat (tuple immuable) est mis en cache pour chaque valeur de N.
     """
     if N <= 3:
-        colors = ['#FF6B6B', '#4ECDC4', '#45B7D1'][:N]
+        colors = ('#FF6B6B', '#4ECDC4', '#45B7D1')[:N]
     elif N <= 7:
-        colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A', 
-                  '#98D8C8', '#F7DC6F', '#BB8FCE'][:N]
+        colors = ('#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A', 
+                  '#98D8C8', '#F7DC6F', '#BB8FCE')[:N]
     elif N <= 12:
-        colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A', 
+        colors = ('#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A', 
                   '#98D8C8', '#F7DC6F', '#BB8FCE', '#85C1E2',
-                  '#F8B88B', '#A8E6CF', '#FFD3B6', '#C7CEEA'][:N]
+                  '#F8B88B', '#A8E6CF', '#FFD3B6', '#C7CEEA')[:N]
     else:
         # Générer des couleurs automatiquement
-        colors = plt.cm.tab20(np.linspace(0, 1, N))
+        colors = tuple(map(tuple, plt.cm.tab20(np.linspace(0, 1, N))))
     
     return colors
 
-def plot_cellular_network(R, centers, frequency_groups, N, results, 
-                          filename='cellular_network.png'):
+def plot_cellular_network(R: float, centers: np.ndarray,
+                          frequency_groups: np.ndarray, N: int,
+                          results: be.AnalysisResult,
+                          filename='cellular_network.png', dpi=150,
+                          compress_level=1, show_labels=True, show=False):
     """
     Visualise le réseau cellulaire hexagonal
     
     Args:
         R: rayon des cellules (km)
-        centers: liste des coordonnées des cellules
-        frequency_groups: groupes de fréquences assignés
+        centers: coordonnées des cellules, de forme (N, 2)
+        frequency_groups: groupes de fréquences assignés, de forme (N,)
         N: taille du motif
-        results: dictionnaire des résultats de calcul
+        results: résultats de calcul (AnalysisResult)
         filename: nom du fichier de sortie
+        dpi: résolution de l'image (300 pour une figure de publication)
+        compress_level: niveau de compression PNG (0-9), 1 = encodage rapide
+        show_labels: afficher le groupe de fréquence de chaque cellule
+            (ignoré au-delà de _MAX_LABELED_CELLS cellules)
+        show: afficher la figure à l'écran après la sauvegarde
     """
-    fig, ax = plt.subplots(figsize=(14, 12))
-    
-    # Palette de couleurs
-    colors = get_color_palette(N)
+    fig, ax = plt.subplots(figsize=(14, 12), layout='constrained')
     
-    # Dessiner chaque cellule hexagonale
-    for (x, y), freq_group in zip(centers, frequency_groups):
-        hexagon = RegularPolygon(
-            (x, y), 
-            numVertices=6, 
-            radius=R,
-            orientation=0,
-            facecolor=colors[freq_group],
-            edgecolor='black',
-            linewidth=1.5,
+    try:
+        # Palette de couleurs
+        colors = get_color_palette(N)
+        
+        centers = np.asarray(centers)
+        
+        # Sommets de toutes les cellules hexagonales, forme (N, 6, 2)
+        verts = centers[:, None, :] + _hex_offsets(R)[None, :, :]
+        
+        # Limites des axes fixées à partir des centres (± R avec une petite
+        # marge) : évite le calcul des limites de données à partir des
+        # chemins de chaque artiste
+        (xmin, ymin), (xmax, ymax) = centers.min(axis=0), centers.max(axis=0)
+        margin = 1.1 * R
+        ax.set_xlim(xmin - margin, xmax + margin)
+        ax.set_ylim(ymin - margin, ymax + margin)
+        ax.set_autoscale_on(False)
+        
+        # Dessiner toutes les cellules en une seule collection
+        hexagons = PolyCollection(
+            verts,
+            facecolors=[colors[g] for g in frequency_groups],
+            edgecolors='black',
+            linewidths=1.5,
             alpha=0.6
         )
-        ax.add_patch(hexagon)
+        ax.add_collection(hexagons, autolim=False)
         
-        # Ajouter un marqueur pour la BTS
-        ax.plot(x, y, 'k^', markersize=8, markerfacecolor='red', 
-                markeredgecolor='black', markeredgewidth=1)
+        # Marqueurs des BTS en un seul appel
+        ax.scatter(centers[:, 0], centers[:, 1], marker='^', s=64, c='red',
+                   edgecolors='black', linewidths=1, zorder=3)
         
-        # Ajouter le numéro de groupe de fréquence
-        ax.text(x, y-0.3*R, f'F{freq_group}', 
-                ha='center', va='center', fontsize=8, fontweight='bold')
-    
-    # Configuration des axes
-    ax.set_aspect('equal')
-    ax.grid(True, alpha=0.3, linestyle='--')
-    ax.set_xlabel('Distance (km)', fontsize=12, fontweight='bold')
-    ax.set_ylabel('Distance (km)', fontsize=12, fontweight='bold')
-    
-    # Titre avec informations
-    title = f'Plan Cellulaire GSM - Motif N={N}\n'
-    title += f'R = {R:.3f} km | D = {results["D_km"]:.3f} km | '
-    title += f'S/I = {results["SIR_dB"]:.2f} dB'
-    ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
-    
-    # Légende
-    legend_elements = []
-    for i in range(N):
+        # Ajouter le numéro de groupe de fréquence (seulement pour les petites
+        # grilles : chaque étiquette est un artiste Text coûteux à dessiner)
+        if show_labels and len(centers) <= _MAX_LABELED_CELLS:
+            labels_xy = centers - [0, 0.3*R]
+            for (x, y), freq_group in zip(labels_xy, frequency_groups):
+                ax.text(x, y, f'F{freq_group}', ha='center', va='center',
+                        fontsize=8, fontweight='bold', clip_on=True)
+        
+        # Configuration des axes
+        ax.set_aspect('equal')
+        ax.grid(True, alpha=0.3, linestyle='--')
+        ax.set_xlabel('Distance (km)', fontsize=12, fontweight='bold')
+        ax.set_ylabel('Distance (km)', fontsize=12, fontweight='bold')
+        
+        # Titre avec informations
+        title = f'Plan Cellulaire GSM - Motif N={N}\n'
+        title += f'R = {R:.3f} km | D = {results.D_km:.3f} km | '
+        title += f'S/I = {results.SIR_dB:.2f} dB'
+        ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
+        
+        # Légende (limitée à _MAX_LEGEND_GROUPS groupes pour les grands N)
+        legend_n = min(N, _MAX_LEGEND_GROUPS)
+        legend_elements = []
+        for i in range(legend_n):
+            legend_elements.append(
+                patches.Patch(facecolor=colors[i], edgecolor='black', 
+                             label=f'Groupe fréquence {i}')
+            )
+        if N > legend_n:
+            legend_elements.append(
+                patches.Patch(facecolor='white', edgecolor='black',
+                             label=f'... +{N - legend_n} groupes')
+            )
         legend_elements.append(
-            patches.Patch(facecolor=colors[i], edgecolor='black', 
-                         label=f'Groupe fréquence {i}')
+            plt.Line2D([0], [0], marker='^', color='w', 
+                       markerfacecolor='red', markeredgecolor='black',
+                       markersize=10, label='BTS (Station de base)')
         )
-    legend_elements.append(
-        plt.Line2D([0], [0], marker='^', color='w', 
-                   markerfacecolor='red', markeredgecolor='black',
-                   markersize=10, label='BTS (Station de base)')
-    )
-    
-    ax.legend(handles=legend_elements, loc='upper left', 
-              bbox_to_anchor=(1.02, 1), fontsize=10)
-    
-    # Informations supplémentaires
-    info_text = f'Canaux/cellule: {results["channels_per_cell"]}\n'
-    info_text += f'Abonnés/cellule: {results["subscribers_per_cell"]:.0f}\n'
-    info_text += f'Utilisateurs actifs: {results["active_users_per_cell"]:.1f}\n'
-    info_text += f'S/I min requis: {results["SIR_min_dB"]:.1f} dB'
-    
-    ax.text(0.02, 0.98, info_text, transform=ax.transAxes,
-            fontsize=10, verticalalignment='top',
-            bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
-    
-    plt.tight_layout()
-    plt.savefig(filename, dpi=300, bbox_inches='tight')
-    print(f"✓ Figure sauvegardée: {filename}")
-    plt.show()
+        
+        ax.legend(handles=legend_elements, loc='upper left', 
+                  bbox_to_anchor=(1.02, 1), fontsize=10)
+        
+        # Informations supplémentaires
+        info_text = f'Canaux/cellule: {results.channels_per_cell}\n'
+        info_text += f'Abonnés/cellule: {results.subscribers_per_cell:.0f}\n'
+        info_text += f'Utilisateurs actifs: {results.active_users_per_cell:.1f}\n'
+        info_text += f'S/I min requis: {results.SIR_min_dB:.1f} dB'
+        
+        ax.text(0.02, 0.98, info_text, transform=ax.transAxes,
+                fontsize=10, verticalalignment='top',
+                bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
+        
+        # La mise en page 'constrained' (définie à la création) remplace
+        # tight_layout ; bbox_inches='tight' retire les marges laissées par
+        # l'aspect 'equal'
+        fig.savefig(filename, dpi=dpi, bbox_inches='tight',
+                    pil_kwargs={'compress_level': compress_level})
+        print(f"✓ Figure sauvegardée: {filename}")
+        if show:
+            plt.show()
+    finally:
+        # Libérer la figure (renderers, caches) après sauvegarde/affichage
+        plt.close(fig)
+
+_ANALYSIS_GETTER = itemgetter(*be.ANALYSIS_PARAMS)
+
+@lru_cache(maxsize=64, typed=True)
+def _analysis_cached(*values):
+    """
+    Analyse complète mise en cache, indexée par les valeurs (et leurs types :
+    N=7 et N=7.0 ne donnent pas le même channels_per_cell) des seuls
+    paramètres lus par be.run_complete_analysis
+    """
+    return be.run_complete_analysis(dict(zip(be.ANALYSIS_PARAMS, values)))
+
+def run_analysis(params):
+    """
+    Effectue l'analyse complète du réseau en réutilisant les résultats déjà
+    calculés pour les mêmes paramètres (AnalysisResult est immuable)
+
+    Si une valeur n'est pas hachable (liste, tableau NumPy...), l'analyse est
+    faite sans cache.
+    """
+    values = _ANALYSIS_GETTER(params)
+    try:
+        hash(values)
+    except TypeError:
+        return be.run_complete_analysis(params)
+    return _analysis_cached(*values)
 
 def compare_patterns(params_base, N_values=[3, 4, 7, 9]):
     """
@@ -192,16 +258,16 @@ def compare_patterns(params_base, N_values=[3, 4, 7, 9]):
     for N in N_values:
         params = params_base.copy()
         params['N'] = N
-        results = be.run_complete_analysis(params)
+        results = run_analysis(params)
         comparison_results[N] = results
         
         print(f"\n📊 MOTIF N = {N}:")
-        print(f"   R = {results['R_km']:.3f} km | D = {results['D_km']:.3f} km")
-        print(f"   S/I = {results['SIR_dB']:.2f} dB (min: {results['SIR_min_dB']:.1f} dB)")
-        print(f"   Canaux/cellule: {results['channels_per_cell']}")
-        print(f"   Utilisateurs actifs: {results['active_users_per_cell']:.1f}")
-        print(f"   Statut S/I: {'✓' if results['SIR_ok'] else '✗'}")
-        print(f"   Statut capacité: {'✓' if results['capacity_ok'] else '✗'}")
+        print(f"   R = {results.R_km:.3f} km | D = {results.D_km:.3f} km")
+        print(f"   S/I = {results.SIR_dB:.2f} dB (min: {results.SIR_min_dB:.1f} dB)")
+        print(f"   Canaux/cellule: {results.channels_per_cell}")
+        print(f"   Utilisateurs actifs: {results.active_users_per_cell:.1f}")
+        print(f"   Statut S/I: {'✓' if results.SIR_ok else '✗'}")
+        print(f"   Statut capacité: {'✓' if results.capacity_ok else '✗'}")
     
     print("="*80 + "\n")
     return comparison_results
@@ -209,21 +275,25 @@ def compare_patterns(params_base, N_values=[3, 4, 7, 9]):
 def create_comparison_table(comparison_results):
     """
     Crée un tableau comparatif formaté
-    """
-    print("\n" + "="*100)
-    print(f"{'N':<5} {'R (km)':<10} {'D (km)':<10} {'S/I (dB)':<12} "
-          f"{'Canaux':<10} {'Util.actifs':<15} {'S/I OK':<10} {'Cap OK':<10}")
-    print("="*100)
-    
-    for N, res in sorted(comparison_results.items()):
-        sir_status = '✓' if res['SIR_ok'] else '✗'
-        cap_status = '✓' if res['capacity_ok'] else '✗'
-        
-        print(f"{N:<5} {res['R_km']:<10.3f} {res['D_km']:<10.3f} "
-              f"{res['SIR_dB']:<12.2f} {res['channels_per_cell']:<10} "
-              f"{res['active_users_per_cell']:<15.1f} {sir_status:<10} {cap_status:<10}")
     
-    print("="*100 + "\n")
+    Le tableau est construit en entier puis écrit en une seule fois.
+    """
+    lines = [
+        "\n" + "="*100,
+        f"{'N':<5} {'R (km)':<10} {'D (km)':<10} {'S/I (dB)':<12} "
+        f"{'Canaux':<10} {'Util.actifs':<15} {'S/I OK':<10} {'Cap OK':<10}",
+        "="*100,
+    ]
+    lines += [
+        f"{N:<5} {res.R_km:<10.3f} {res.D_km:<10.3f} "
+        f"{res.SIR_dB:<12.2f} {res.channels_per_cell:<10} "
+        f"{res.active_users_per_cell:<15.1f} "
+        f"{'✓' if res.SIR_ok else '✗':<10} {'✓' if res.capacity_ok else '✗':<10}"
+        for N, res in sorted(comparison_results.items())
+    ]
+    lines.append("="*100 + "\n")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def interactive_menu():
     """
@@ -260,15 +330,15 @@ def edit_params_interactive():
     
     print("\n📝 Édition des paramètres (appuyez sur Entrée pour garder la valeur par défaut):")
     
+    # Type de chaque paramètre (int ou float), déterminé une seule fois
+    types = {key: type(value) for key, value in params.items()}
+    
     for key, default_value in params.items():
         user_input = input(f"{key} [{default_value}]: ").strip()
         if user_input:
             try:
                 # Convertir au bon type
-                if isinstance(default_value, int):
-                    params[key] = int(user_input)
-                else:
-                    params[key] = float(user_input)
+                params[key] = types[key](user_input)
             except ValueError:
                 print(f"Valeur invalide, conservation de {default_value}")
     
@@ -294,18 +364,18 @@ def main():
     
     # Analyse complète
     print("\n🔄 Analyse en cours...")
-    results = be.run_complete_analysis(params)
+    results = run_analysis(params)
     be.print_results(results, params)
     
     # Vérification et recommandations
-    if not results['SIR_ok']:
+    if not results.SIR_ok:
         print("⚠️  ATTENTION: Le critère S/I n'est pas satisfait!")
         print("   Solutions possibles:")
         print("   - Augmenter N (motif cellulaire)")
         print("   - Réduire le rayon R (plus de cellules)")
         print("   - Augmenter la puissance d'émission")
     
-    if not results['capacity_ok']:
+    if not results.capacity_ok:
         print("⚠️  ATTENTION: Surcharge de capacité!")
         print("   Solutions possibles:")
         print("   - Réduire N (plus de canaux par cellule)")
@@ -314,10 +384,10 @@ def main():
     # Visualisation
     print("\n🎨 Génération de la visualisation...")
     grid_size = int(input("Taille de la grille (3, 5, 7): ").strip() or "7")
-    centers = create_hexagon_grid(results['R_km'], grid_size)
+    centers = create_hexagon_grid(results.R_km, grid_size)
     freq_groups = assign_frequency_groups(centers, params['N'])
-    plot_cellular_network(results['R_km'], centers, freq_groups, 
-                         params['N'], results)
+    plot_cellular_network(results.R_km, centers, freq_groups, 
+                         params['N'], results, show=True)
     
     # Comparaison de motifs
     compare = input("\n🔍 Comparer avec d'autres motifs? (o/n): ").strip().lower()
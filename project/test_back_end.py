@@ -0,0 +1,158 @@
+"""
+test_back_end.py
+Vérifications de cohérence des chemins de calcul optimisés de back_end.py
+"""
+
+import itertools
+import math
+
+import numpy as np
+import pytest
+
+import back_end as be
+
+
+def _assert_same_results(expected, obtained):
+    for key, value in expected.to_dict().items():
+        other = getattr(obtained, key)
+        if isinstance(value, (bool, np.bool_)):
+            assert bool(value) == bool(other), key
+        else:
+            assert math.isclose(value, other, rel_tol=1e-12), (key, value, other)
+
+
+def test_make_specialized_matches_run_complete_analysis():
+    scalar_types = (int, float, np.float64)
+    for N, n, SIR_min_dB, cast in itertools.product(
+        (3, 4, 7, 12), (3.0, 3.5, 4.0), (9, 17, 25), scalar_types
+    ):
+        params = be.get_default_params()
+        params.update(N=N, Pathloss_exp=cast(n), SIR_min_dB=cast(SIR_min_dB))
+        if cast is np.float64:
+            params["N"] = np.float64(N)
+
+        expected = be.run_complete_analysis(params)
+        specialized = be.make_specialized(
+            params["N"], params["Pathloss_exp"], params["SIR_min_dB"]
+        )
+        obtained = specialized(
+            params["P_BTS_dBm"],
+            params["P_MS_dBm"],
+            params["P_sens_dBm"],
+            params["N_f"],
+            params["Dst_ab"],
+            params["T_act"],
+            params["d0_km"],
+        )
+
+        _assert_same_results(expected, obtained)
+
+
+def test_make_specialized_accepts_numpy_and_special_values():
+    args = (43, 23, -100, 124, 20, 0.1, 1)
+    for n in np.linspace(2.7, 4, 14):
+        be.make_specialized(np.int64(7), n, np.float64(17))(*args)
+
+    result = be.make_specialized(7, 3.5, float("inf"))(*args)
+    assert result.SIR_ok is False
+
+
+def test_run_complete_analysis_rejects_invalid_inputs():
+    # Mêmes exceptions avec ou sans le module compilé back_end_core
+    for overrides, error in (
+        ({"Pathloss_exp": 0}, ZeroDivisionError),
+        ({"N": 0}, ValueError),
+        ({"N": -3}, ValueError),
+    ):
+        params = be.get_default_params()
+        params.update(overrides)
+        with pytest.raises(error):
+            be.run_complete_analysis(params)
+
+
+def test_save_params_round_trips_numpy_and_special_values(tmp_path):
+    params = be.get_default_params()
+    params.update(
+        Pathloss_exp=np.float64(3.5), SIR_min_dB=np.float64(17), N=np.int64(7)
+    )
+    filepath = tmp_path / "params.json"
+
+    be.save_params(params, str(filepath))
+    loaded = be.load_params(str(filepath))
+    assert loaded == params
+    _assert_same_results(
+        be.run_complete_analysis(params), be.run_complete_analysis(loaded)
+    )
+
+    # inf s'écrit Infinity avec ou sans orjson, et se relit
+    params["SIR_min_dB"] = float("inf")
+    be.save_params(params, str(filepath))
+    assert b"Infinity" in filepath.read_bytes()
+    assert be.load_params(str(filepath))["SIR_min_dB"] == float("inf")
+
+
+def _assert_vec_matches_scalar(params, results, shape):
+    for key, values in results.items():
+        assert values.shape == shape, key
+    for index in np.ndindex(shape):
+        point = {
+            key: np.asarray(value)[index] if np.ndim(value) else value
+            for key, value in params.items()
+        }
+        expected = be.run_complete_analysis(point).to_dict()
+        for key, value in expected.items():
+            obtained = results[key][index]
+            if isinstance(value, (bool, np.bool_)):
+                assert bool(value) == bool(obtained), (key, index)
+            else:
+                assert math.isclose(value, obtained, rel_tol=1e-12), (key, index)
+
+
+def test_run_complete_analysis_vec_matches_scalar_sweep():
+    params = be.get_default_params()
+    params.update(
+        N=np.array([3, 4, 7])[:, None],
+        Pathloss_exp=np.array([2.7, 3.0, 3.5, 4.0])[None, :],
+    )
+    results = be.run_complete_analysis_vec(params)
+
+    # Valeurs du balayage diffusées pour la comparaison point par point
+    N, n = np.broadcast_arrays(params["N"], params["Pathloss_exp"])
+    _assert_vec_matches_scalar(dict(params, N=N, Pathloss_exp=n), results, (3, 4))
+
+
+def test_run_complete_analysis_vec_scalar_and_list_inputs():
+    params = be.get_default_params()
+    _assert_vec_matches_scalar(params, be.run_complete_analysis_vec(params), ())
+
+    params["SIR_min_dB"] = [9, 17, 25]
+    _assert_vec_matches_scalar(params, be.run_complete_analysis_vec(params), (3,))
+
+
+def test_run_monte_carlo_numba_matches_numpy(monkeypatch):
+    pytest.importorskip("numba")
+    params = be.get_default_params()
+    assert be._numba_monte_carlo() is not None
+    compiled = be.run_monte_carlo(params, 10000, 8.0, seed=1)
+
+    monkeypatch.setattr(be, "_numba_monte_carlo", lambda: None)
+    fallback = be.run_monte_carlo(params, 10000, 8.0, seed=1)
+
+    np.testing.assert_allclose(compiled["R_km"], fallback["R_km"], rtol=1e-12)
+    np.testing.assert_allclose(compiled["D_km"], fallback["D_km"], rtol=1e-12)
+    assert compiled["SIR_dB"] == fallback["SIR_dB"]
+
+
+def test_run_monte_carlo_numpy_fallback(monkeypatch):
+    monkeypatch.setattr(be, "_numba_monte_carlo", lambda: None)
+    params = be.get_default_params()
+    expected = be.run_complete_analysis(params)
+
+    results = be.run_monte_carlo(params, 5000, 8.0, seed=1)
+    assert results["R_km"].shape == results["D_km"].shape == (5000,)
+    assert math.isclose(results["SIR_dB"], expected.SIR_dB, rel_tol=1e-12)
+
+    # Sans shadowing, chaque tirage redonne le rayon déterministe
+    results = be.run_monte_carlo(params, 100, 0.0, seed=1)
+    np.testing.assert_allclose(results["R_km"], expected.R_km, rtol=1e-12)
+    assert math.isclose(results["R_km"].mean(), expected.R_km, rel_tol=1e-12)